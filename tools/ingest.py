@@ -16,43 +16,128 @@ State is stored in repo_dir/.ingest/state.json and manifest.json
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import date
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 from PIL import Image, ImageOps
 
+# Same output as json.dumps(ensure_ascii=False, indent=2) + "\n", just faster.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Resize backend, picked once at import time. libvips fuses shrink-on-load,
+# Lanczos3 and encoding into one streamed pipeline; without it we use Pillow
+# (ideally pillow-simd, a drop-in replacement with AVX2 convolution kernels).
+# The process pool in main() already runs one worker per core, so each worker
+# gets a single libvips thread instead of a per-core threadpool. libvips reads
+# this at init, so it has to be set before the import; workers inherit it.
+os.environ.setdefault("VIPS_CONCURRENCY", "1")
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+_RESIZER = "vips" if pyvips is not None else "pillow"
+
+# In-process libtesseract: loads the traineddata once instead of per image.
+# Falls back to the tesseract CLI.
+# One OpenMP thread per pool worker, otherwise N workers x OpenMP threads
+# oversubscribe the cores. libgomp reads this when tesserocr loads it, so it
+# has to be set before the import; forked workers and CLI children inherit it.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+try:
+    from tesserocr import PSM, PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
+# one per worker process, see _init_ocr_worker()
+_TESS_API = None
+
+# Hashes are only used for dedup, so prefer the fast one. state.json records
+# which algorithm its hashes were made with, see migrate_state().
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+HASH_ALGO = "blake3" if blake3 is not None else "sha256"
+HASH_CHUNK = 4 * 1024 * 1024
+
+# Pillow first box-reduces by an integer factor while the image stays at least
+# this many times the target size, then runs Lanczos on the smaller image.
+# 3.0 is indistinguishable from a full Lanczos pass on our scans.
+_REDUCING_GAP = 3.0
+
+BASE_URL = "https://git.not4bflu55.de"
+
 SUPPORTED_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".tif", ".tiff", ".bmp"}
 
+_UMLAUT = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_RE_DASHES = re.compile(r"-{2,}")
+
 
 def sh(cmd: List[str], cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, cwd=str(cwd) if cwd else None, check=check, text=True, capture_output=True)
 
 
 def slugify(s: str) -> str:
-    s = s.strip().lower()
-    s = s.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = s.strip().lower().translate(_UMLAUT)
+    s = _RE_NON_ALNUM.sub("-", s)
+    s = _RE_DASHES.sub("-", s).strip("-")
     return s or "untitled"
 
 
-def file_sha256(p: Path) -> str:
-    h = hashlib.sha256()
+def hash_available(algo: str) -> bool:
+    if algo == "blake3":
+        return blake3 is not None
+    return algo in hashlib.algorithms_available
+
+
+def _new_hasher(algo: str):
+    return blake3.blake3() if algo == "blake3" else hashlib.new(algo)
+
+
+def file_hash(p: Path, algo: str = HASH_ALGO) -> str:
+    h = _new_hasher(algo)
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
+def read_and_hash(p: Path, algo: str = HASH_ALGO) -> Tuple[bytes, str]:
+    """
+    Read a file once, returning its bytes and content hash, so the decoder
+    doesn't have to read it from disk a second time.
+    """
+    data = p.read_bytes()
+    # hash the buffer in place, no chunk copies
+    h = _new_hasher(algo)
+    h.update(data)
+    return data, h.hexdigest()
+
+
 def ensure_dirs(repo: Path) -> Dict[str, Path]:
     d = {
         "images": repo / "images",
@@ -66,14 +151,28 @@ def ensure_dirs(repo: Path) -> Dict[str, Path]:
 
 def load_json(p: Path, default):
     if p.exists():
+        if orjson is not None:
+            return orjson.loads(p.read_bytes())
         return json.loads(p.read_text(encoding="utf-8"))
     return default
 
 
 def save_json(p: Path, obj) -> None:
+    if orjson is not None:
+        p.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     p.write_text(json.dumps(obj, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
+def load_hash_cache(p: Path) -> Dict[str, str]:
+    """
+    Content hashes of source files keyed by "<algo>|<path>|<mtime_ns>|<size>",
+    so unchanged files only cost a stat() on the next run.
+    Machine-local (absolute paths): git-ignored, never committed.
+    """
+    return load_json(p, default={})
+
+
 @dataclass
 class WorkMeta:
     title: str
@@ -89,79 +188,305 @@ class WorkMeta:
     work_md_path: str  # repo-relative
 
 
-def find_new_images(source_dir: Path, seen_hashes: set) -> List[Path]:
+def migrate_state(state: Dict) -> Dict[str, set]:
+    """
+    Bring state (in place) to HASH_ALGO. seen_hashes made with another
+    algorithm move to state["legacy_seen"][<algo>] and are kept there, so
+    previously ingested images stay known; find_new_images() checks files
+    against them and re-records matches under HASH_ALGO.
+    The recorded hash_algo must be available here (checked in main()), so
+    this never migrates to a weaker algorithm.
+    Returns {algo: set of legacy hashes}, leaving out algorithms that can't
+    be computed here.
+    """
+    for w in state.get("works", []):
+        if "sha256" in w:
+            w["content_hash"] = w.pop("sha256")
+            w["hash_algo"] = "sha256"
+
+    legacy = state.setdefault("legacy_seen", {})
+    algo = state.get("hash_algo", "sha256")
+    if algo != HASH_ALGO:
+        legacy[algo] = legacy.get(algo, []) + state.get("seen_hashes", [])
+        state["seen_hashes"] = []
+        state["hash_algo"] = HASH_ALGO
+    return {a: set(hs) for a, hs in legacy.items() if hs and hash_available(a)}
+
+
+def find_new_images(
+    source_dir: Path,
+    seen_hashes: Dict[str, None],
+    hash_cache: Dict[str, str],
+    legacy_hashes: Optional[Dict[str, set]] = None,
+) -> List[Tuple[Path, str]]:
+    """
+    Returns (path, content_hash) of every source image not in seen_hashes.
+    hash_cache is updated in place and afterwards holds only the files
+    currently in source_dir. Only files unknown under HASH_ALGO are checked
+    against legacy_hashes (their digests are cached too); matches are added
+    to seen_hashes under their HASH_ALGO hash.
+    """
     imgs = []
-    for p in sorted(source_dir.iterdir()):
-        if not p.is_file():
+    fresh = {}
+    # scandir's DirEntry answers is_file()/stat() from the directory read
+    # where the OS allows it, instead of a stat() per path
+    with os.scandir(source_dir) as it:
+        entries = sorted(
+            (e for e in it if os.path.splitext(e.name)[1].lower() in SUPPORTED_EXTS and e.is_file()),
+            key=lambda e: e.name,
+        )
+    for e in entries:
+        p = Path(e.path)
+        st = e.stat()
+        stamp = f"{p}|{st.st_mtime_ns}|{st.st_size}"
+        key = f"{HASH_ALGO}|{stamp}"
+        h = hash_cache.get(key) or file_hash(p)
+        fresh[key] = h
+        if h in seen_hashes:
             continue
-        if p.suffix.lower() not in SUPPORTED_EXTS:
+        known = False
+        for algo, hs in (legacy_hashes or {}).items():
+            lkey = f"{algo}|{stamp}"
+            lh = hash_cache.get(lkey) or file_hash(p, algo)
+            fresh[lkey] = lh
+            if lh in hs:
+                known = True
+                break
+        if known:
+            seen_hashes[h] = None
             continue
-        h = file_sha256(p)
-        if h not in seen_hashes:
-            imgs.append(p)
+        imgs.append((p, h))
+    hash_cache.clear()
+    hash_cache.update(fresh)
     return imgs
 
 
 def web_convert(
-    src: Path,
+    src: Union[Path, bytes],
     dst: Path,
     max_width: int,
     fmt: str,
     webp_quality: int,
     jpeg_quality: int,
     png_optimize: bool,
-) -> Tuple[int, int]:
-    img = Image.open(src)
-    img = ImageOps.exif_transpose(img)  # respect orientation
+    gray: bool = False,
+    webp_method: int = 4,
+) -> Tuple[int, int, Optional[Image.Image]]:
+    """
+    src is a path or the already read file contents.
+    Returns (width, height, gray_image); gray_image is the resized picture as
+    8-bit grayscale for OCR if gray=True, else None.
+    """
+    fmt = fmt.lower()
+    if _RESIZER == "vips":
+        try:
+            return _vips_convert(src, dst, max_width, fmt, webp_quality, jpeg_quality, png_optimize, gray, webp_method)
+        except pyvips.Error:
+            # e.g. .bmp on libvips builds without the magick loader:
+            # Pillow below can still read it
+            pass
+
+    img = Image.open(io.BytesIO(src) if isinstance(src, bytes) else src)
+    # EXIF is readable before load(), so draft() below can use it too
+    orientation = img.getexif().get(0x0112, 1)  # 0x0112 = Orientation
+    if img.format == "JPEG":
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale (DCT scaling) while the
+        # side that ends up as the output width stays >= max_width. Only that
+        # side is constrained (the other gets 1), otherwise the short side
+        # would block scaling on ordinary portrait/landscape scans.
+        # Orientations 5-8 swap width and height.
+        img.draft("RGB", (1, max_width) if orientation in (5, 6, 7, 8) else (max_width, 1))
+    # respect orientation; exif_transpose copies the image even when there is
+    # nothing to do, so only call it for a non-default orientation tag
+    if orientation != 1:
+        img = ImageOps.exif_transpose(img)
     w, h = img.size
     if w > max_width:
         new_h = int(h * (max_width / w))
-        img = img.resize((max_width, new_h), Image.LANCZOS)
+        # pillow-simd vectorizes exactly this filter
+        img = img.resize((max_width, new_h), Image.LANCZOS, reducing_gap=_REDUCING_GAP)
         w, h = img.size
 
-    fmt = fmt.lower()
     if fmt == "webp":
-        img.save(dst, format="WEBP", quality=webp_quality, method=6)
+        # method 4 instead of 6: several times faster, <1% larger on scans
+        img.save(dst, format="WEBP", quality=webp_quality, method=webp_method, lossless=False)
     elif fmt == "jpg" or fmt == "jpeg":
         if img.mode in ("RGBA", "LA"):
             # flatten alpha for JPEG
-            bg = Image.new("RGB", img.size, (255, 255, 255))
-            bg.paste(img, mask=img.split()[-1])
-            img = bg
+            img = _flatten_alpha(img)
         else:
             img = img.convert("RGB")
         img.save(dst, format="JPEG", quality=jpeg_quality, optimize=True, progressive=True)
     elif fmt == "png":
-        # keep alpha if exists
-        img.save(dst, format="PNG", optimize=png_optimize)
+        # keep alpha if exists. zlib level 6 is its default; png_optimize's
+        # level 9 (same output as optimize=True) takes ~6x as long for ~4%
+        # smaller files, hence off by default.
+        img.save(dst, format="PNG", compress_level=9 if png_optimize else 6)
+    else:
+        raise ValueError(f"Unsupported output_format: {fmt}")
+
+    gray_img = None
+    if gray:
+        # onto white first, like the libvips path: transparent pixels usually
+        # store black and would turn the whole background black
+        gray_img = _flatten_alpha(img) if img.mode in ("RGBA", "LA", "PA") else img
+        if gray_img.mode != "L":
+            gray_img = gray_img.convert("L")
+    return w, h, gray_img
+
+
+def _flatten_alpha(img: Image.Image) -> Image.Image:
+    """Composite an RGBA/LA/PA image onto white, returning RGB."""
+    if img.mode == "PA":
+        img = img.convert("RGBA")
+    if np is None:
+        bg = Image.new("RGB", img.size, (255, 255, 255))
+        bg.paste(img, mask=img.split()[-1])
+        return bg
+    # one vectorized blend instead of split() + masked paste
+    arr = np.asarray(img, dtype=np.uint8)
+    color = arr[..., :-1].astype(np.uint16)
+    a = arr[..., -1:].astype(np.uint16)
+    # +127 rounds to nearest like paste() does, so output doesn't depend on
+    # whether NumPy is installed
+    out = ((color * a + 255 * (255 - a) + 127) // 255).astype(np.uint8)
+    if img.mode == "LA":
+        return Image.fromarray(out[..., 0]).convert("RGB")
+    return Image.fromarray(out)
+
+
+def _vips_convert(
+    src: Union[Path, bytes],
+    dst: Path,
+    max_width: int,
+    fmt: str,
+    webp_quality: int,
+    jpeg_quality: int,
+    png_optimize: bool,
+    gray: bool = False,
+    webp_method: int = 4,
+) -> Tuple[int, int, Optional[Image.Image]]:
+    # thumbnail() autorotates via EXIF and never upscales with size="down";
+    # the huge height bound makes max_width the only constraint.
+    # libvips savers keep EXIF/XMP/IPTC by default; strip=True drops them
+    # (camera, GPS, serials) like the Pillow path, which writes none.
+    if isinstance(src, bytes):
+        img = pyvips.Image.thumbnail_buffer(src, max_width, height=10_000_000, size="down")
+    else:
+        img = pyvips.Image.thumbnail(str(src), max_width, height=10_000_000, size="down")
+
+    if fmt == "webp":
+        img.webpsave(str(dst), Q=webp_quality, effort=webp_method, strip=True)
+    elif fmt == "jpg" or fmt == "jpeg":
+        if img.hasalpha():
+            # flatten alpha for JPEG
+            img = img.flatten(background=255)
+        img.jpegsave(str(dst), Q=jpeg_quality, optimize_coding=True, interlace=True, strip=True)
+    elif fmt == "png":
+        img.pngsave(str(dst), compression=9 if png_optimize else 6, strip=True)
     else:
         raise ValueError(f"Unsupported output_format: {fmt}")
-    return w, h
+
+    gray_img = None
+    if gray:
+        g = img.flatten(background=255) if img.hasalpha() else img
+        g = g.colourspace("b-w").cast("uchar")
+        gray_img = Image.frombytes("L", (g.width, g.height), g.write_to_memory())
+    return img.width, img.height, gray_img
 
 
-def run_tesseract_ocr(image_path: Path, lang: str) -> str:
-    # Use tesseract to stdout
-    # Note: some tesseract builds support 'stdout' target; if not, we use temp file.
+def run_tesseract_ocr(img: Image.Image, lang: str) -> str:
+    # Pipe the in-memory grayscale (mode "L") image as PNM through
+    # stdin/stdout: no re-read of the encoded web asset, no temp files.
+    buf = io.BytesIO()
+    img.save(buf, format="PPM")
     try:
-        proc = sh(["tesseract", str(image_path), "stdout", "-l", lang], check=False)
-        if proc.returncode == 0:
-            return (proc.stdout or "").strip()
+        proc = subprocess.run(
+            ["tesseract", "stdin", "stdout", "-l", lang, "--dpi", "300"],
+            input=buf.getvalue(),
+            capture_output=True,
+            check=False,
+        )
     except FileNotFoundError:
         return ""
-    # fallback with temp file
-    tmpbase = image_path.parent / (image_path.stem + "_ocr_tmp")
-    try:
-        sh(["tesseract", str(image_path), str(tmpbase), "-l", lang], check=False)
-        txt = (tmpbase.with_suffix(".txt").read_text(encoding="utf-8", errors="replace")).strip()
-        return txt
-    except Exception:
+    if proc.returncode != 0:
         return ""
-    finally:
-        for ext in (".txt", ".log"):
-            try:
-                tmpbase.with_suffix(ext).unlink(missing_ok=True)  # py3.8+: missing_ok
-            except Exception:
-                pass
+    return proc.stdout.decode("utf-8", errors="replace").strip()
+
+
+def run_tesseract_ocr_api(img: Image.Image, api) -> str:
+    api.SetImage(img)  # already mode "L", see web_convert()
+    api.SetSourceResolution(300)
+    return api.GetUTF8Text().strip()
+
+
+def _init_ocr_worker(lang: str) -> None:
+    global _TESS_API
+    try:
+        _TESS_API = PyTessBaseAPI(lang=lang, psm=PSM.AUTO)
+    except RuntimeError:
+        # e.g. traineddata not found: leave it to the CLI path
+        _TESS_API = None
+
+
+def _staging_path(src: Path, cfg: Dict) -> Path:
+    # Named after the full source filename: all images are staged up front,
+    # so "a.png" and "a.jpg" must not share a temp file.
+    return Path(cfg["ingest_dir"]) / f"_tmp_{src.name}.{cfg['output_format']}"
+
+
+def prepare(src: Path, cfg: Dict, h: Optional[str] = None) -> Optional[Tuple[Path, str, str]]:
+    """
+    Non-interactive part of ingesting one image: hash (unless h is already
+    known), convert to a temp web asset, OCR. Runs in a worker process, so
+    everything it needs comes in via the plain cfg dict.
+    Returns (tmp_out, ocr_text, content_hash), or None if the image can't be
+    processed; it is reported and stays in source_dir for the next run.
+    """
+    try:
+        return _prepare(src, cfg, h)
+    except Exception as e:
+        print(f"WARN: {src.name} übersprungen: {e}")
+        _staging_path(src, cfg).unlink(missing_ok=True)
+        return None
+
+
+def _prepare(src: Path, cfg: Dict, h: Optional[str]) -> Tuple[Path, str, str]:
+    buf = None
+    if cfg["dry_run"]:
+        h = h or file_hash(src)
+    elif h is None:
+        buf, h = read_and_hash(src)
+    else:
+        buf = src.read_bytes()
+
+    # Stage the web asset in a temp file until the final slug is known.
+    tmp_out = _staging_path(src, cfg)
+    if tmp_out.exists():
+        tmp_out.unlink()
+
+    if cfg["dry_run"]:
+        return tmp_out, "", h
+
+    _, _, gray = web_convert(
+        src=buf,
+        dst=tmp_out,
+        max_width=cfg["max_width"],
+        fmt=cfg["output_format"],
+        webp_quality=cfg["webp_quality"],
+        webp_method=cfg["webp_method"],
+        jpeg_quality=cfg["jpeg_quality"],
+        png_optimize=cfg["png_optimize"],
+        gray=cfg["run_ocr"],
+    )
+
+    ocr_text = ""
+    if gray is not None:
+        if _TESS_API is not None:
+            ocr_text = run_tesseract_ocr_api(gray, _TESS_API)
+        else:
+            ocr_text = run_tesseract_ocr(gray, lang=cfg["tesseract_lang"])
+    return tmp_out, ocr_text, h
 
 
 def prompt_list(prompt: str) -> List[str]:
@@ -282,25 +607,79 @@ def update_readme(readme_path: Path, works: List[Tuple[str, str]]) -> None:
         txt = header + "\n".join(index_lines)
 
     if marker_a in txt and marker_b in txt:
-        pre = txt.split(marker_a)[0].rstrip() + "\n"
-        post = txt.split(marker_b)[1].lstrip()
-        txt = pre + "\n".join(index_lines) + post
+        pre, _, rest = txt.partition(marker_a)
+        _, _, post = rest.partition(marker_b)
+        txt = pre.rstrip() + "\n" + "\n".join(index_lines) + post.lstrip()
     else:
         txt = header + "\n".join(index_lines)
 
     readme_path.write_text(txt, encoding="utf-8")
 
 
-def git_commit_push(repo: Path, message: str, push: bool) -> None:
-    sh(["git", "add", "-A"], cwd=repo)
-    # only commit if there are changes
-    st = sh(["git", "status", "--porcelain"], cwd=repo)
-    if not st.stdout.strip():
+def write_sitemap(sitemap_path: Path, md_paths: List[str], extra_pages: List[str]) -> None:
+    """
+    md_paths: repo-relative work pages, straight from the works state,
+    so no directory scan is needed.
+    extra_pages: repo-relative pages that are not in the works state
+    (added by hand) but must stay listed.
+    """
+    today = date.today().isoformat()
+    pages = dict.fromkeys(md_paths + extra_pages)  # dedup, keep order
+    entries = "\n".join(
+        f"  <url>\n    <loc>{BASE_URL}/{md}</loc>\n    <lastmod>{today}</lastmod>\n  </url>" for md in pages
+    )
+    xml = (
+        "<?xml version='1.0' encoding='UTF-8'?>\n"
+        "<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>\n"
+        + (entries + "\n" if entries else "")
+        + "</urlset>"
+    )
+    sitemap_path.write_text(xml, encoding="utf-8")
+
+
+def spawn_detached(cmd: List[str], cwd: Path, log: Path) -> None:
+    """
+    Fire and forget: the child outlives the script. Its output goes to log.
+    It has no terminal, so git must not try to prompt for credentials:
+    GIT_TERMINAL_PROMPT=0 makes that fail loudly in the log.
+    """
+    out = log.open("w")
+    try:
+        subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            stdout=out,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            start_new_session=True,
+        )
+    finally:
+        out.close()  # the child keeps its own copy of the fd
+
+
+def git_commit_push(repo: Path, message: str, push: bool, paths: List[str], ping_urls: List[str]) -> None:
+    """
+    paths: repo-relative files written by this run; only these are staged,
+    so git doesn't have to walk the whole worktree.
+    ping_urls: requested only after a successful push, when the new sitemap
+    is actually published.
+    """
+    sh(["git", "add", "--"] + paths, cwd=repo)
+    # only commit if there are changes (exit code 1 = staged changes)
+    st = sh(["git", "diff", "--cached", "--quiet"], cwd=repo, check=False)
+    if st.returncode == 0:
         print("git: keine Änderungen – kein Commit.")
         return
     sh(["git", "commit", "-m", message], cwd=repo)
     if push:
-        sh(["git", "push"], cwd=repo)
+        # don't block on the network, the commit is already in place locally
+        log = repo / ".ingest" / "push.log"
+        script = "git push"
+        if ping_urls:
+            pings = "; ".join(shlex.join(["curl", "-sS", u]) for u in ping_urls)
+            script += f" && {{ {pings}; }}"
+        spawn_detached(["sh", "-c", script], cwd=repo, log=log)
+        print(f"git push läuft im Hintergrund, Ausgabe: {log}")
 
 
 def main() -> int:
@@ -324,21 +703,41 @@ def main() -> int:
     dirs = ensure_dirs(repo_dir)
     state_path = dirs["ingest"] / "state.json"
     manifest_path = dirs["ingest"] / "manifest.json"
-
-    state = load_json(state_path, default={"seen_hashes": [], "works": []})
-    seen_hashes = set(state.get("seen_hashes", []))
+    hash_cache_path = dirs["ingest"] / "hash_cache.json"
+
+    state = load_json(state_path, default={"seen_hashes": [], "works": [], "hash_algo": HASH_ALGO})
+    recorded_algo = state.get("hash_algo", "sha256")
+    if not hash_available(recorded_algo):
+        # e.g. state.json from a machine with blake3, run without it: falling
+        # back would re-hash everything with a weaker algorithm
+        print(f"ERROR: state.json uses hash_algo '{recorded_algo}', which is not available here "
+              f"(pip install {recorded_algo})")
+        return 2
+    legacy_hashes = migrate_state(state)
+    # dict as insertion-ordered set: O(1) lookups, and saving it needs no
+    # sort while new hashes still land at the end of the list
+    seen_hashes = dict.fromkeys(state.get("seen_hashes", []))
     works_state = state.get("works", [])
 
-    new_imgs = find_new_images(source_dir, seen_hashes)
+    hash_cache = load_hash_cache(hash_cache_path)
+    new_imgs = find_new_images(source_dir, seen_hashes, hash_cache, legacy_hashes)
+    new_paths = [p for p, _ in new_imgs]
+    new_hashes = [h for _, h in new_imgs]
     if not new_imgs:
+        if not bool(cfg.get("dry_run", False)):
+            # keep a hash migration even when there is nothing to ingest
+            state["seen_hashes"] = list(seen_hashes)
+            save_json(state_path, state)
+            save_json(hash_cache_path, hash_cache)
         print("Keine neuen Bilder im Source-Verzeichnis.")
         return 0
 
     output_format = str(cfg.get("output_format", "webp")).lower()
     max_width = int(cfg.get("max_width", 2000))
     webp_quality = int(cfg.get("webp_quality", 82))
+    webp_method = int(cfg.get("webp_method", 4))
     jpeg_quality = int(cfg.get("jpeg_quality", 85))
-    png_optimize = bool(cfg.get("png_optimize", True))
+    png_optimize = bool(cfg.get("png_optimize", False))
 
     run_ocr = bool(cfg.get("run_ocr", True))
     tess_lang = str(cfg.get("tesseract_lang", "deu"))
@@ -348,144 +747,136 @@ def main() -> int:
     dry_run = bool(cfg.get("dry_run", False))
     auto_commit = bool(cfg.get("auto_commit", True))
     auto_push = bool(cfg.get("auto_push", True))
+    extra_sitemap_pages = [str(x) for x in cfg.get("extra_sitemap_pages") or []]
 
     manifest = load_json(manifest_path, default={"works": []})
 
-    for src in new_imgs:
-        h = file_sha256(src)
-        base_default_title = src.stem.replace("_", " ").replace("-", " ").strip()
-        default_title = base_default_title[:60] if base_default_title else "Untitled"
-        default_year = date.today().year
-
-        # Stage to a temp web asset to OCR against (better than huge originals)
-        tmp_out = dirs["ingest"] / f"_tmp_{src.stem}.{output_format}"
-        if tmp_out.exists():
-            tmp_out.unlink()
-
-        if not dry_run:
-            web_convert(
-                src=src,
-                dst=tmp_out,
-                max_width=max_width,
-                fmt=output_format,
-                webp_quality=webp_quality,
-                jpeg_quality=jpeg_quality,
-                png_optimize=png_optimize,
-            )
-
-        ocr_text = ""
-        if run_ocr and not dry_run:
-            ocr_text = run_tesseract_ocr(tmp_out, lang=tess_lang)
-
-        meta = prompt_meta(
-            default_title=default_title,
-            default_year=default_year,
-            creator=creator,
-            default_license=default_license,
-            language=language,
-            ocr_text=ocr_text,
-            source_filename=src.name,
-        )
-
-        slug = slugify(f"{meta.title}-{meta.year}")
-        # Avoid collisions
-        img_rel = f"images/{slug}.{output_format}"
-        md_rel = f"works/{slug}.md"
+    prep_cfg = {
+        "ingest_dir": str(dirs["ingest"]),
+        "output_format": output_format,
+        "max_width": max_width,
+        "webp_quality": webp_quality,
+        "webp_method": webp_method,
+        "jpeg_quality": jpeg_quality,
+        "png_optimize": png_optimize,
+        "run_ocr": run_ocr,
+        "tesseract_lang": tess_lang,
+        "dry_run": dry_run,
+    }
 
-        img_dst = repo_dir / img_rel
-        md_dst = repo_dir / md_rel
+    # Phase A: convert + OCR all new images in parallel, so the prompts below
+    # only wait for the user (thread limits per worker: see the imports).
+    # With tesserocr each worker opens its API once and reuses it for every
+    # image it gets.
+    pool_kw = {}
+    if run_ocr and not dry_run and PyTessBaseAPI is not None:
+        pool_kw = {"initializer": _init_ocr_worker, "initargs": (tess_lang,)}
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), **pool_kw) as pool:
+        prepared = list(pool.map(prepare, new_paths, repeat(prep_cfg), new_hashes))
+
+    # Phase B: interactive metadata, file moves, state updates
+    touched = [
+        "README.md",
+        "sitemap.xml",
+        ".ingest/state.json",
+        ".ingest/manifest.json",
+    ]
+    # slugs already in use, so collision checks below need no filesystem probes
+    taken = {p.stem for p in dirs["images"].iterdir()} | {p.stem for p in dirs["works"].iterdir()}
+    staged = [(src, *res) for src, res in zip(new_paths, prepared) if res is not None]
+    ingested = 0
+    try:
+        for src, tmp_out, ocr_text, h in staged:
+            base_default_title = src.stem.replace("_", " ").replace("-", " ").strip()
+            default_title = base_default_title[:60] if base_default_title else "Untitled"
+            default_year = date.today().year
+
+            meta = prompt_meta(
+                default_title=default_title,
+                default_year=default_year,
+                creator=creator,
+                default_license=default_license,
+                language=language,
+                ocr_text=ocr_text,
+                source_filename=src.name,
+            )
 
-        # If exists, ask for suffix
-        n = 2
-        while img_dst.exists() or md_dst.exists():
-            slug2 = f"{slug}-{n}"
-            img_rel = f"images/{slug2}.{output_format}"
-            md_rel = f"works/{slug2}.md"
+            slug = slugify(f"{meta.title}-{meta.year}")
+            # Avoid collisions: append -2, -3, ... until the slug is free
+            final_slug = slug
+            n = 2
+            while final_slug in taken:
+                final_slug = f"{slug}-{n}"
+                n += 1
+            taken.add(final_slug)
+
+            img_rel = f"images/{final_slug}.{output_format}"
+            md_rel = f"works/{final_slug}.md"
             img_dst = repo_dir / img_rel
             md_dst = repo_dir / md_rel
-            n += 1
-
-        meta.image_path = img_rel
-        meta.work_md_path = md_rel
-
-        # Write outputs
-        if dry_run:
-            print(f"[dry-run] would write {img_rel} and {md_rel}")
-        else:
-            shutil.move(str(tmp_out), str(img_dst))
-            md_dst.write_text(render_work_md(meta), encoding="utf-8")
-
-        # Update state / manifest
-        works_state.append(
-            {
-                "title": meta.title,
-                "year": meta.year,
-                "slug": Path(meta.work_md_path).stem,
-                "md": meta.work_md_path.replace("\\", "/"),
-                "image": meta.image_path.replace("\\", "/"),
-                "sha256": h,
-            }
-        )
-        seen_hashes.add(h)
-        manifest["works"] = works_state
-
-        # Move original source into an archive subfolder to prevent re-ingest
-        if not dry_run:
-            archive_dir = source_dir / "_ingested"
-            archive_dir.mkdir(exist_ok=True)
-            shutil.move(str(src), str(archive_dir / src.name))
 
-        # Cleanup temp if still exists
-        try:
-            tmp_out.unlink(missing_ok=True)  # type: ignore[arg-type]
-        except Exception:
-            pass
+            meta.image_path = img_rel
+            meta.work_md_path = md_rel
+
+            # Write outputs
+            if dry_run:
+                print(f"[dry-run] would write {img_rel} and {md_rel}")
+            else:
+                shutil.move(str(tmp_out), str(img_dst))
+                md_dst.write_text(render_work_md(meta), encoding="utf-8")
+                touched += [img_rel, md_rel]
+
+            # Update state / manifest
+            works_state.append(
+                {
+                    "title": meta.title,
+                    "year": meta.year,
+                    "slug": Path(meta.work_md_path).stem,
+                    "md": meta.work_md_path.replace("\\", "/"),
+                    "image": meta.image_path.replace("\\", "/"),
+                    "content_hash": h,
+                    "hash_algo": HASH_ALGO,
+                }
+            )
+            seen_hashes[h] = None
+            manifest["works"] = works_state
+
+            # Move original source into an archive subfolder to prevent re-ingest
+            if not dry_run:
+                archive_dir = source_dir / "_ingested"
+                archive_dir.mkdir(exist_ok=True)
+                shutil.move(str(src), str(archive_dir / src.name))
+            ingested += 1
+    finally:
+        # temp assets of images not (yet) moved into images/, e.g. after Ctrl-C
+        for _, tmp_out, _, _ in staged:
+            tmp_out.unlink(missing_ok=True)
 
     # Update README index from works_state
     works_list = [(w["title"], w["md"]) for w in works_state]
     if not dry_run:
         update_readme(repo_dir / "README.md", works_list)
 
-    # Persist state/manifest
-    state["seen_hashes"] = sorted(seen_hashes)
+    # Persist state/manifest/sitemap
+    state["seen_hashes"] = list(seen_hashes)
     state["works"] = works_state
     if not dry_run:
         save_json(state_path, state)
         save_json(manifest_path, manifest)
-
-
-# --- sitemap.xml generieren ---
- #   from pathlib import Path
-    import datetime
-
-    BASE_URL = "https://git.not4bflu55.de"
-    urls = []
-    for md in (repo_dir / "works").glob("*.md"):
-        urls.append(f"{BASE_URL}/{md.as_posix()}")
-
-    today = datetime.date.today().isoformat()
-    xml = ["<?xml version='1.0' encoding='UTF-8'?>",
-           "<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>"]
-    for u in urls:
-        xml += ["  <url>", f"    <loc>{u}</loc>", f"    <lastmod>{today}</lastmod>", "  </url>"]
-    xml.append("</urlset>")
-
-    (repo_dir / "sitemap.xml").write_text("\n".join(xml), encoding="utf-8")
+        save_json(hash_cache_path, hash_cache)
+        write_sitemap(repo_dir / "sitemap.xml", [w["md"] for w in works_state], extra_sitemap_pages)
 
     # git commit/push
     if auto_commit and not dry_run:
-        msg = f"ingest: {len(new_imgs)} work(s) ({date.today().isoformat()})"
-        git_commit_push(repo_dir, msg, push=auto_push)
+        msg = f"ingest: {ingested} work(s) ({date.today().isoformat()})"
+        # optionaler Ping (sanfter Stupser), nach erfolgreichem Push
+        pings = [
+            f"https://www.google.com/ping?sitemap={BASE_URL}/sitemap.xml",
+            f"https://www.bing.com/ping?sitemap={BASE_URL}/sitemap.xml",
+        ]
+        git_commit_push(repo_dir, msg, push=auto_push, paths=touched, ping_urls=pings)
 
     print("Fertig.")
-
-# optionaler Ping (sanfter Stupser)
-    try:
-        sh(["curl", f"https://www.google.com/ping?sitemap={BASE_URL}/sitemap.xml"], check=False)
-        sh(["curl", f"https://www.bing.com/ping?sitemap={BASE_URL}/sitemap.xml"], check=False)
-    except Exception:
-        pass
-
     return 0
 
 if __name__ == "__main__":